@@ -4,18 +4,61 @@ Description: Configuration file for setting up environment variables and default
 """
 
 import os
+from functools import cached_property
+from typing import Optional
 
 
-class Config:
+class _Config:
     """
     Configuration class to encapsulate environment variables and provide default values.
+
+    Each variable is read from the environment on first access and cached afterwards.
     """
 
-    REDIS_QUEUE_URL = os.getenv("REDIS_QUEUE_URL", None)
-    DATABASE = os.getenv("DATABASE", "news-llm")
-    MONGO_HOST = os.getenv("MONGO_HOST", "0.0.0.0")
-    MONGO_PORT = os.getenv("MONGO_PORT", "27017")
-    MONGO_USERNAME = os.getenv("MONGO_USERNAME", "")
-    MONGO_PASSWORD = os.getenv("MONGO_PASSWORD", "")
-    OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
-    SLACK_WEBHOOK_URL = os.getenv("SLACK_WEBHOOK_URL")
+    @cached_property
+    def redis_queue_url(self) -> Optional[str]:
+        """Redis URL used by the Redis queue."""
+        return os.getenv("REDIS_QUEUE_URL", None)
+
+    @cached_property
+    def database(self) -> str:
+        """Name of the database."""
+        return os.getenv("DATABASE", "news-llm")
+
+    @cached_property
+    def mongo_host(self) -> str:
+        """MongoDB host."""
+        return os.getenv("MONGO_HOST", "0.0.0.0")
+
+    @cached_property
+    def mongo_port(self) -> str:
+        """MongoDB port."""
+        return os.getenv("MONGO_PORT", "27017")
+
+    @cached_property
+    def mongo_username(self) -> str:
+        """MongoDB username."""
+        return os.getenv("MONGO_USERNAME", "")
+
+    @cached_property
+    def mongo_password(self) -> str:
+        """MongoDB password."""
+        return os.getenv("MONGO_PASSWORD", "")
+
+    @cached_property
+    def openrouter_api_key(self) -> Optional[str]:
+        """API key for OpenRouter."""
+        return os.getenv("OPENROUTER_API_KEY")
+
+    @cached_property
+    def slack_webhook_url(self) -> Optional[str]:
+        """Slack webhook URL used by the Slack dispatch channel."""
+        return os.getenv("SLACK_WEBHOOK_URL")
+
+    @cached_property
+    def cache_dir(self) -> str:
+        """Directory of the on-disk caches."""
+        return os.path.expanduser(os.getenv("NEWSLLM_CACHE_DIR", "~/.cache/newsllm"))
+
+
+config = _Config()
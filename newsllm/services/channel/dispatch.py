@@ -3,14 +3,20 @@ Author: Aayush Shah
 Description: This module defines outbound channels for sending news to respective platforms, such as Slack.
 """
 
-import json
+import time
+from collections import deque
+from typing import Deque, Iterable, List
 
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from newsllm.services.channel.base import BaseChannel
 from newsllm.structures import News
 
+DIVIDER_BLOCK = {"type": "divider"}
+
 
 class BaseDispatchChannel(BaseChannel):
     """
@@ -32,22 +38,120 @@ class BaseDispatchChannel(BaseChannel):
         """
         raise RuntimeError("Dispatch channels cannot receive messages.")
 
+    def send_batch(self, news_iterable: Iterable[News], **kwargs) -> list:
+        """
+        Send multiple news objects to the channel.
+
+        The default implementation sends each news object individually. Subclasses that support batched
+        payloads should override this method.
+
+        Args:
+            news_iterable (Iterable[News]): The news objects to send.
+            **kwargs: Additional keyword arguments for channel-specific options.
+
+        Returns:
+            list: The responses for each sent message.
+        """
+        return [self.send(news, **kwargs) for news in news_iterable]
+
+
+class _TokenBucket:
+    """
+    A token bucket used to throttle outgoing requests.
+
+    Tokens are refilled continuously at `rate` tokens per second, up to `capacity` tokens.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Initialize the token bucket as full.
+
+        Args:
+            rate (float): The number of tokens added per second.
+            capacity (int): The maximum number of tokens the bucket can hold.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        """
+        Add the tokens accumulated since the last refill.
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def ready(self) -> bool:
+        """
+        Check whether a token can be consumed without blocking.
+
+        Returns:
+            bool: True if a token is available, False otherwise.
+        """
+        self._refill()
+        return self.tokens >= 1
+
+    def consume(self) -> None:
+        """
+        Consume a token, blocking until one is available.
+        """
+        self._refill()
+        if self.tokens < 1:
+            time.sleep((1 - self.tokens) / self.rate)
+            self._refill()
+        self.tokens -= 1
+
 
 class SlackDispatchChannel(BaseDispatchChannel):
     """
     A dispatch channel for sending news to Slack.
 
-    This class provides functionality to send formatted news messages to a specified Slack webhook URL.
+    This class provides functionality to send formatted news messages to a specified Slack webhook URL. Outgoing
+    messages are throttled with a token bucket to stay within Slack's webhook rate limits.
+
+    Attributes:
+        MAX_BLOCKS_PER_MESSAGE (int): Maximum number of blocks Slack accepts in a single message.
+        MAX_RATE_LIMITED_RESENDS (int): Maximum number of consecutive rate limited messages `send_batch` resends
+            before leaving the remaining news pending for the next batch.
     """
 
-    def __init__(self, webhook_url: str):
+    MAX_BLOCKS_PER_MESSAGE = 50
+    MAX_RATE_LIMITED_RESENDS = 3
+    SLACK_HOOKS_URL = "https://hooks.slack.com"
+
+    def __init__(self, webhook_url: str, rate: float = 1.0, burst: int = 5):
         """
         Initialize the SlackDispatchChannel with the given webhook URL.
 
         Args:
             webhook_url (str): The Slack webhook URL to send messages to.
+            rate (float): The sustained number of messages sent per second. Defaults to 1.0.
+            burst (int): The maximum number of messages sent back to back. Defaults to 5.
         """
         self.webhook_url = webhook_url
+        self.session = self._create_session()
+        self._bucket = _TokenBucket(rate, burst)
+        self._pending: Deque[list] = deque()
+        self._pending_blocks = 0
+        self._retry_at = 0.0
+
+    def _create_session(self) -> requests.Session:
+        """
+        Create a pooled HTTP session for the Slack webhook that retries failed connections.
+
+        Only connection errors are retried, as the message has not reached Slack yet. Read errors and error responses
+        are not retried, since Slack may already have posted the message and a webhook POST is not idempotent. Rate
+        limiting is handled by the token bucket and the Retry-After handling in `send_message`.
+
+        Returns:
+            requests.Session: The session used to post messages to Slack.
+        """
+        retries = Retry(total=3, connect=3, read=0, status=0, other=0, backoff_factor=0.5, raise_on_status=False)
+        session = requests.Session()
+        session.mount(self.SLACK_HOOKS_URL, HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retries))
+        return session
 
     def format_message(self, news: News):
         """
@@ -59,7 +163,7 @@ class SlackDispatchChannel(BaseDispatchChannel):
         Returns:
             list: A list of blocks representing the formatted Slack message.
         """
-        summary_blockquote = "\n".join([f">{line}" for line in news.summary.split("\n")])
+        summary_blockquote = ">" + news.summary.replace("\n", "\n>")
         blocks = [
             {
                 "type": "header",
@@ -81,7 +185,7 @@ class SlackDispatchChannel(BaseDispatchChannel):
                 "type": "section",
                 "text": {
                     "type": "mrkdwn",
-                    "text": f"*Tags:* _{', '.join(list(map(str,news.tags)))}_\n",
+                    "text": f"*Tags:* _{', '.join(map(str, news.tags))}_\n",
                 },
             },
             {
@@ -95,6 +199,57 @@ class SlackDispatchChannel(BaseDispatchChannel):
         ]
         return blocks
 
+    def format_batch(self, news_list: Iterable[News]) -> List[list]:
+        """
+        Format multiple news objects into Slack message payloads, separated by dividers.
+
+        The blocks are split into chunks that respect Slack's block limit per message. A single news item is never
+        split across two messages.
+
+        Args:
+            news_list (Iterable[News]): The news objects to format.
+
+        Returns:
+            List[list]: A list of block lists, one per Slack message.
+        """
+        items = deque(self._format_batch_item(news) for news in news_list)
+        chunks = []
+        while items:
+            chunks.append([block for news_blocks in self._take_message_items(items) for block in news_blocks])
+        return chunks
+
+    def _take_message_items(self, items: Deque[list]) -> List[list]:
+        """
+        Pop the news blocks at the front of `items` that fit together in a single Slack message.
+
+        The first item is always taken, so an item larger than the block limit is still sent on its own.
+
+        Args:
+            items (Deque[list]): The blocks of each news object, in sending order.
+
+        Returns:
+            List[list]: The blocks of each news object taken for the message.
+        """
+        message_items = []
+        message_blocks = 0
+        while items and (not message_items or message_blocks + len(items[0]) <= self.MAX_BLOCKS_PER_MESSAGE):
+            news_blocks = items.popleft()
+            message_items.append(news_blocks)
+            message_blocks += len(news_blocks)
+        return message_items
+
+    def _format_batch_item(self, news: News) -> list:
+        """
+        Format a news object into blocks followed by a divider, for use in a batched message.
+
+        Args:
+            news (News): The news object to format.
+
+        Returns:
+            list: The blocks for the news object.
+        """
+        return self.format_message(news) + [DIVIDER_BLOCK]
+
     def send_message(self, message: str):
         """
         Send a message to Slack.
@@ -112,11 +267,62 @@ class SlackDispatchChannel(BaseDispatchChannel):
         payload = {"text": "News Update", "blocks": message}
         if not self.webhook_url:
             raise ValueError("Slack webhook URL is required to send message to Slack.")
-        response = requests.post(
-            self.webhook_url,
-            data=json.dumps(payload),
-        )
-        logger.info("Slack message sent with status code {response.status_code}")
+        self._wait_for_slot()
+        response = self.session.post(self.webhook_url, json=payload)
+        logger.info("Slack message sent with status code {}", response.status_code)
+        if response.status_code == 429:
+            self._defer_after(response)
+        return response
+
+    def _wait_for_slot(self) -> None:
+        """
+        Block until a message may be sent, honouring any Retry-After delay and the rate limit.
+        """
+        delay = self._retry_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        self._bucket.consume()
+
+    def _can_send(self) -> bool:
+        """
+        Check whether a message can be sent right away without blocking.
+
+        Returns:
+            bool: True if a message can be sent immediately, False otherwise.
+        """
+        return time.monotonic() >= self._retry_at and self._bucket.ready()
+
+    def _defer_after(self, response: requests.Response) -> None:
+        """
+        Postpone the next message according to the Retry-After header of a rate limited response.
+
+        Args:
+            response (requests.Response): The rate limited response from the Slack API.
+        """
+        try:
+            retry_after = float(response.headers.get("Retry-After", 1 / self._bucket.rate))
+        except ValueError:
+            retry_after = 1 / self._bucket.rate
+        logger.warning("Slack rate limit hit, waiting {} seconds before the next message", retry_after)
+        self._retry_at = time.monotonic() + retry_after
+
+    def _flush(self) -> requests.Response:
+        """
+        Send as many pending news blocks as fit in a single Slack message.
+
+        If the message is rate limited, its blocks are put back at the front of the pending queue so they are resent
+        once the Retry-After delay has passed.
+
+        Returns:
+            requests.Response: The response from the Slack API.
+        """
+        message_items = self._take_message_items(self._pending)
+        message = [block for news_blocks in message_items for block in news_blocks]
+        self._pending_blocks -= len(message)
+        response = self.send_message(message)
+        if response.status_code == 429:
+            self._pending.extendleft(reversed(message_items))
+            self._pending_blocks += len(message)
         return response
 
     def send(self, news: News, **kwargs):
@@ -132,3 +338,66 @@ class SlackDispatchChannel(BaseDispatchChannel):
         """
         message = self.format_message(news)
         return self.send_message(message)
+
+    def send_batch(self, news_iterable: Iterable[News], **kwargs) -> List[requests.Response]:
+        """
+        Send multiple news objects to Slack using as few requests as possible.
+
+        News items are buffered and a message is sent whenever a full message is pending and the rate limit allows
+        it, so items arriving while the channel is throttled are coalesced into the next message. Pending news is
+        then sent with `flush`.
+
+        News that is still pending after repeated rate limiting is not dropped: check `pending_count` and call
+        `flush` or `send_batch` again later to deliver it.
+
+        Args:
+            news_iterable (Iterable[News]): The news objects to send.
+            **kwargs: Additional keyword arguments for message formatting.
+
+        Returns:
+            List[requests.Response]: The responses from the Slack API, one per sent message.
+        """
+        responses = []
+        for news in news_iterable:
+            news_blocks = self._format_batch_item(news)
+            self._pending.append(news_blocks)
+            self._pending_blocks += len(news_blocks)
+            while self._pending_blocks >= self.MAX_BLOCKS_PER_MESSAGE and self._can_send():
+                responses.append(self._flush())
+        responses.extend(self.flush())
+        return responses
+
+    @property
+    def pending_count(self) -> int:
+        """Number of news objects buffered but not yet delivered to Slack."""
+        return len(self._pending)
+
+    def flush(self) -> List[requests.Response]:
+        """
+        Send all pending news objects to Slack.
+
+        Rate limited messages are resent after the Retry-After delay. After `MAX_RATE_LIMITED_RESENDS` consecutive
+        rate limited messages, the remaining news stays pending, see `pending_count`.
+
+        Returns:
+            List[requests.Response]: The responses from the Slack API, one per sent message.
+        """
+        responses = []
+        rate_limited = 0
+        while self._pending and rate_limited <= self.MAX_RATE_LIMITED_RESENDS:
+            response = self._flush()
+            responses.append(response)
+            rate_limited = rate_limited + 1 if response.status_code == 429 else 0
+        if self._pending:
+            logger.warning("Slack kept rate limiting, {} news items left pending", len(self._pending))
+        return responses
+
+    def __del__(self):
+        """
+        Close the HTTP session when the instance is deleted, reporting any news that was never delivered.
+        """
+        if getattr(self, "_pending", None):
+            logger.error("Slack channel discarded with {} undelivered news items", len(self._pending))
+        session = getattr(self, "session", None)
+        if session is not None:
+            session.close()
@@ -4,24 +4,26 @@ Description: This module defines inbound channels for receiving messages from va
 """
 
 from newsllm.services.channel.base import BaseChannel
+from newsllm.structures import News
 
 
 class BaseInboundChannel(BaseChannel):
     """
     Base class for inbound channels.
 
-    This class inherits from BaseChannel and overrides the receive method to raise a RuntimeError,
-    indicating that dispatch channels cannot receive messages.
+    This class inherits from BaseChannel and overrides the send method to raise a RuntimeError,
+    indicating that inbound channels cannot send messages. Subclasses must implement the receive method.
     """
 
-    def receive(self, **kwargs) -> str:
+    def send(self, news: News, **kwargs):
         """
-        Raises a RuntimeError as inbound channels do not support dispatch functionality.
+        Raises a RuntimeError as inbound channels do not support sending messages.
 
         Args:
+            news (News): The news object to send (not used).
             **kwargs: Additional keyword arguments (not used).
 
         Raises:
-            RuntimeError: Always raised as dispatch channels cannot receive messages.
+            RuntimeError: Always raised as inbound channels cannot send messages.
         """
-        raise RuntimeError("Dispatch channels cannot receive messages.")
+        raise RuntimeError("Inbound channels cannot send messages.")
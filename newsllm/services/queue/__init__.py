@@ -1,16 +1,27 @@
 """
 Author: Aayush Shah
-Description: Initialization file for the queue package. Sets up dynamic discovery and imports for queue classes.
+Description: Initialization file for the queue package. Sets up imports for queue classes and the queue factory.
 """
 
 from newsllm.services.queue.base import AbstractQueue
-from newsllm.services.queue.factory import get_queue
+from newsllm.services.queue.codec import QueueCodec
+from newsllm.services.queue.factory import get_queue, get_queue_class
 from newsllm.services.queue.list_queue import ListQueue
-from newsllm.services.queue.redis_queue import RedisQueue
 
 __all__ = [
     "AbstractQueue",
     "get_queue",
+    "get_queue_class",
     "ListQueue",
+    "QueueCodec",
     "RedisQueue",
 ]
+
+
+def __getattr__(name: str):
+    """
+    Lazily import queue backends with heavy dependencies, such as RedisQueue, on first access.
+    """
+    if name == "RedisQueue":
+        return get_queue_class("redis")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,7 +4,7 @@ Description: Abstract base class for queue implementations.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Generator
+from typing import Any, Generator, Iterable, List
 
 
 class AbstractQueue(ABC):
@@ -38,6 +38,19 @@ class AbstractQueue(ABC):
         """
         raise NotImplementedError
 
+    def enqueue_many(self, items: Iterable[Any]) -> None:
+        """
+        Add multiple items to the queue.
+
+        The default implementation enqueues each item individually. Subclasses should override this method when the
+        backend supports adding several items at once.
+
+        Args:
+            items (Iterable[Any]): The items to be added to the queue, in order.
+        """
+        for item in items:
+            self.enqueue(item)
+
     @abstractmethod
     def dequeue(self) -> Any:
         """
@@ -51,6 +64,27 @@ class AbstractQueue(ABC):
         """
         raise NotImplementedError
 
+    def dequeue_batch(self, count: int) -> List[Any]:
+        """
+        Remove and return up to `count` items from the queue.
+
+        The default implementation dequeues each item individually. Subclasses should override this method when the
+        backend supports removing several items at once.
+
+        Args:
+            count (int): The maximum number of items to remove.
+
+        Returns:
+            List[Any]: The items removed from the queue, in order. Empty if the queue is empty.
+        """
+        items = []
+        while len(items) < count:
+            item = self.dequeue()
+            if item is None:
+                break
+            items.append(item)
+        return items
+
     @abstractmethod
     def dequeue_generator(self) -> Generator[Any, None, None]:
         """
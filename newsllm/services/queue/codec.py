@@ -0,0 +1,52 @@
+"""
+Author: Aayush Shah
+Description: Codec for serializing news articles into compact queue payloads using msgpack.
+"""
+
+from typing import Optional, Set
+
+import msgpack
+
+from newsllm.structures import News
+
+
+class QueueCodec:
+    """
+    Encodes news articles into msgpack payloads for queues, and decodes them back.
+
+    msgpack payloads are smaller than JSON strings and faster to encode and decode, which matters most for the large
+    text fields of a news article.
+    """
+
+    def __init__(self, exclude: Optional[Set[str]] = None):
+        """
+        Initialize the codec.
+
+        Args:
+            exclude (Optional[Set[str]]): News fields to leave out of encoded payloads. Defaults to None.
+        """
+        self.exclude = exclude
+
+    def encode(self, news: News) -> bytes:
+        """
+        Encode a news article into a queue payload.
+
+        Args:
+            news (News): The news article to encode.
+
+        Returns:
+            bytes: The msgpack encoded news article.
+        """
+        return msgpack.packb(news.model_dump(mode="json", exclude=self.exclude))
+
+    def decode(self, payload: bytes) -> News:
+        """
+        Decode a queue payload into a news article.
+
+        Args:
+            payload (bytes): The msgpack encoded news article.
+
+        Returns:
+            News: The decoded news article.
+        """
+        return News.model_validate(msgpack.unpackb(payload, raw=False))
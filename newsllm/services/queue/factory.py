@@ -3,22 +3,42 @@ Author: Aayush Shah
 Description: Factory module for creating queue instances based on specified type and environment configuration.
 """
 
-import importlib
-import os
-import pkgutil
-import sys
+from functools import lru_cache
 from typing import Dict, Type
 
+from newsllm.config import config
 from newsllm.services.queue.base import AbstractQueue
+from newsllm.utils import import_string
 
-# Automatically import all modules in the 'queue' package
-package = sys.modules[__name__].__package__
-package_path = os.path.join(os.path.dirname(__file__))
-for _, module_name, _ in pkgutil.iter_modules([package_path]):
-    importlib.import_module(f"{package}.{module_name}")
+# Registry of available queue classes, imported on first use so that unused backends are never loaded
+QUEUE_CLASSES: Dict[str, str] = {
+    "list": "newsllm.services.queue.list_queue:ListQueue",
+    "redis": "newsllm.services.queue.redis_queue:RedisQueue",
+}
 
-# Create a dictionary of available queue classes
-QUEUE_CLASSES: Dict[str, Type[AbstractQueue]] = {cls.queue_type: cls for cls in AbstractQueue.__subclasses__()}
+_resolved_queue_classes: Dict[str, Type[AbstractQueue]] = {}
+
+
+def get_queue_class(queue_type: str) -> Type[AbstractQueue]:
+    """
+    Resolve the queue class registered for the given queue type, importing its module if needed.
+
+    Args:
+        queue_type (str): The type of the queue. Should be a key of `QUEUE_CLASSES`.
+
+    Returns:
+        Type[AbstractQueue]: The queue class.
+
+    Raises:
+        ValueError: If the specified queue_type is not supported.
+    """
+    queue_class = _resolved_queue_classes.get(queue_type)
+    if queue_class is None:
+        if queue_type not in QUEUE_CLASSES:
+            raise ValueError(f"Unsupported queue type: {queue_type}")
+        queue_class = import_string(QUEUE_CLASSES[queue_type])
+        _resolved_queue_classes[queue_type] = queue_class
+    return queue_class
 
 
 def get_queue(queue_name: str = "", queue_type: str = "list") -> AbstractQueue:
@@ -26,10 +46,11 @@ def get_queue(queue_name: str = "", queue_type: str = "list") -> AbstractQueue:
     Factory function to get a queue instance based on the specified type and environment configuration.
 
     This function allows selecting between different queue implementations based on the queue_type argument.
+    Instances are cached, so the same instance is returned for each unique queue name and type.
 
     Args:
         queue_name (str): The name of the queue. Defaults to an empty string.
-        queue_type (str): The type of the queue. Should match the `queue_type` attribute of a queue class.
+        queue_type (str): The type of the queue. Should be a key of `QUEUE_CLASSES`.
 
     Returns:
         AbstractQueue: An instance of the specified queue type.
@@ -37,12 +58,25 @@ def get_queue(queue_name: str = "", queue_type: str = "list") -> AbstractQueue:
     Raises:
         ValueError: If the specified queue_type is not supported or required environment variables are missing.
     """
-    if queue_type not in QUEUE_CLASSES:
-        raise ValueError(f"Unsupported queue type: {queue_type}")
+    # Arguments are passed positionally so that keyword and positional calls share the same cache entry
+    return _create_queue(queue_name, queue_type)
+
 
-    QueueClass = QUEUE_CLASSES[queue_type]
+@lru_cache(maxsize=None)
+def _create_queue(queue_name: str, queue_type: str) -> AbstractQueue:
+    """
+    Create a queue instance of the given type. Results are cached per queue name and type.
+
+    Args:
+        queue_name (str): The name of the queue.
+        queue_type (str): The type of the queue.
+
+    Returns:
+        AbstractQueue: An instance of the specified queue type.
+    """
+    QueueClass = get_queue_class(queue_type)
     if queue_type == "redis":
-        redis_url = os.getenv("REDIS_QUEUE_URL", None)
+        redis_url = config.redis_queue_url
         if not redis_url:
             raise ValueError("REDIS_QUEUE_URL environment variable not set")
         return QueueClass(queue_name=queue_name, url=redis_url)
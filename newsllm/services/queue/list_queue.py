@@ -1,23 +1,21 @@
 """
 Author: Aayush Shah
-Description: Implementation of a queue using a list (deque) with logging and singleton pattern.
+Description: Implementation of a queue using a list (deque) with logging support.
 """
 
 from collections import deque
-from typing import Any, Generator, Optional
+from typing import Any, Generator, Iterable, List, Optional
 
 from loguru import logger
 
 from newsllm.services.queue.base import AbstractQueue
-from newsllm.services.utils import SingletonMetaBase
 
 
-class ListQueue(AbstractQueue, metaclass=SingletonMetaBase):
+class ListQueue(AbstractQueue):
     """
     A queue implementation using a deque (double-ended queue) with logging support.
 
-    This class follows the singleton pattern, ensuring that only one instance
-    of ListQueue exists for each unique queue name.
+    Use `get_queue` to share a single instance of ListQueue for each unique queue name.
     """
 
     queue_type = "list"
@@ -40,9 +38,20 @@ class ListQueue(AbstractQueue, metaclass=SingletonMetaBase):
         Args:
             item (Any): The item to be added to the queue.
         """
-        logger.debug(f"Enqueue {str(item)[:30]} to ListQueue {self.queue_name}")
+        logger.opt(lazy=True).debug("Enqueue {} to ListQueue {}", lambda: str(item)[:30], lambda: self.queue_name)
         self.queue.append(item)
 
+    def enqueue_many(self, items: Iterable[Any]) -> None:
+        """
+        Add multiple items to the queue and log the operation.
+
+        Args:
+            items (Iterable[Any]): The items to be added to the queue, in order.
+        """
+        size = len(self.queue)
+        self.queue.extend(items)
+        logger.debug("Enqueue {} items to ListQueue {}", len(self.queue) - size, self.queue_name)
+
     def dequeue(self) -> Optional[Any]:
         """
         Remove and return an item from the queue. Log the operation.
@@ -53,9 +62,23 @@ class ListQueue(AbstractQueue, metaclass=SingletonMetaBase):
         if not self.queue:
             return None
         item = self.queue.popleft()
-        logger.debug(f"Dequeue {str(item)[:30]} from ListQueue {self.queue_name}")
+        logger.opt(lazy=True).debug("Dequeue {} from ListQueue {}", lambda: str(item)[:30], lambda: self.queue_name)
         return item
 
+    def dequeue_batch(self, count: int) -> List[Any]:
+        """
+        Remove and return up to `count` items from the queue. Log the operation.
+
+        Args:
+            count (int): The maximum number of items to remove.
+
+        Returns:
+            List[Any]: The items removed from the queue, in order. Empty if the queue is empty.
+        """
+        items = [self.queue.popleft() for _ in range(min(count, len(self.queue)))]
+        logger.debug("Dequeue {} items from ListQueue {}", len(items), self.queue_name)
+        return items
+
     def dequeue_generator(self) -> Generator[Any, None, None]:
         """
         Create a generator to dequeue items from the queue one at a time.
@@ -63,8 +86,14 @@ class ListQueue(AbstractQueue, metaclass=SingletonMetaBase):
         Yields:
             Any: The next item from the queue.
         """
-        while self.queue:
-            yield self.dequeue()
+        count = 0
+        try:
+            while True:
+                yield self.queue.popleft()
+                count += 1
+        except IndexError:
+            pass
+        logger.debug(f"Drained {count} items from ListQueue {self.queue_name}")
 
     def size(self) -> int:
         """
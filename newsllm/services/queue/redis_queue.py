@@ -1,37 +1,37 @@
 """
 Author: Aayush Shah
-Description: Implementation of a queue using Redis with logging and singleton pattern.
+Description: Implementation of a queue using Redis with logging support.
 """
 
-from typing import Any, Generator, Optional
+from typing import Any, Generator, Iterable, List, Optional
 
 import redis
 from loguru import logger
 
-from newsllm.config import Config
+from newsllm.config import config
 from newsllm.services.queue.base import AbstractQueue
-from newsllm.services.utils import SingletonMetaBase
 
 
-class RedisQueue(AbstractQueue, metaclass=SingletonMetaBase):
+class RedisQueue(AbstractQueue):
     """
     A queue implementation using Redis with logging support.
 
-    This class follows the singleton pattern, ensuring that only one instance
-    of RedisQueue exists for each unique queue name.
+    Use `get_queue` to share a single instance of RedisQueue for each unique queue name.
     """
 
     queue_type = "redis"
+    prefetch_size = 100
 
-    def __init__(self, queue_name: str = "", url: str = Config.REDIS_QUEUE_URL):
+    def __init__(self, queue_name: str = "", url: Optional[str] = None):
         """
         Initialize the RedisQueue with a queue name and Redis URL.
 
         Args:
             queue_name (str): The name of the queue. Defaults to an empty string.
-            url (str): The Redis server URL. Defaults to Config.REDIS_QUEUE_URL.
+            url (Optional[str]): The Redis server URL. Defaults to config.redis_queue_url.
         """
         super().__init__(queue_name)
+        url = url or config.redis_queue_url
         self.client = redis.from_url(url)
         logger.info(f"RedisQueue {self.queue_name} initialized for client URL {url}")
 
@@ -42,9 +42,22 @@ class RedisQueue(AbstractQueue, metaclass=SingletonMetaBase):
         Args:
             item (Any): The item to be added to the queue.
         """
-        logger.info(f"Enqueue {str(item)[:10]} to {self.queue_name}")
+        logger.opt(lazy=True).info("Enqueue {} to {}", lambda: str(item)[:10], lambda: self.queue_name)
         self.client.lpush(self.queue_name, item)
 
+    def enqueue_many(self, items: Iterable[Any]) -> None:
+        """
+        Add multiple items to the Redis queue in a single round-trip and log the operation.
+
+        Args:
+            items (Iterable[Any]): The items to be added to the queue, in order.
+        """
+        items = list(items)
+        if not items:
+            return
+        logger.info("Enqueue {} items to {}", len(items), self.queue_name)
+        self.client.lpush(self.queue_name, *items)
+
     def dequeue(self) -> Optional[Any]:
         """
         Remove and return an item from the Redis queue.
@@ -54,22 +67,43 @@ class RedisQueue(AbstractQueue, metaclass=SingletonMetaBase):
         """
         item = self.client.rpop(self.queue_name)
         if item:
-            logger.info(f"Dequeue {str(item)[:10]} from {self.queue_name}")
+            logger.opt(lazy=True).info("Dequeue {} from {}", lambda: str(item)[:10], lambda: self.queue_name)
         return item
 
+    def dequeue_batch(self, count: int) -> List[Any]:
+        """
+        Remove and return up to `count` items from the Redis queue in a single round-trip.
+
+        Requires Redis 6.2 or newer for the `count` argument of RPOP.
+
+        Args:
+            count (int): The maximum number of items to remove.
+
+        Returns:
+            List[Any]: The items removed from the queue, in order. Empty if the queue is empty.
+        """
+        items = self.client.rpop(self.queue_name, count) or []
+        if items:
+            logger.info("Dequeue {} items from {}", len(items), self.queue_name)
+        return items
+
     def dequeue_generator(self) -> Generator[Any, None, None]:
         """
         Create a generator to dequeue items from the Redis queue one at a time.
 
+        Items are prefetched from Redis in batches of `prefetch_size` to avoid a round-trip per item.
+
         Yields:
             Any: The next item from the queue.
         """
+        count = 0
         while True:
-            item = self.client.lpop(self.queue_name)
-            if item is None:
+            items = self.dequeue_batch(self.prefetch_size)
+            if not items:
                 break
-            logger.info(f"Yield {str(item)[:10]} from {self.queue_name}")
-            yield item
+            yield from items
+            count += len(items)
+        logger.info(f"Drained {count} items from {self.queue_name}")
 
     def size(self) -> int:
         """
@@ -79,7 +113,7 @@ class RedisQueue(AbstractQueue, metaclass=SingletonMetaBase):
             int: The number of items in the queue.
         """
         size = self.client.llen(self.queue_name)
-        logger.info(f"Size of {self.queue_name} is {size}")
+        logger.info("Size of {} is {}", self.queue_name, size)
         return size
 
     def clear(self) -> None:
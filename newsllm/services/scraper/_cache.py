@@ -0,0 +1,98 @@
+"""
+Author: Aayush Shah
+Description: On-disk HTTP response cache used by the scrapers to turn repeated fetches into conditional requests.
+"""
+
+import asyncio
+import os
+import threading
+from typing import Optional, Tuple
+
+import httpx
+from loguru import logger
+
+from newsllm.config import config
+
+CachedResponse = Tuple[Optional[str], Optional[str], str, bytes]
+"""Cached entry stored per URL: (etag, last_modified, content_type, body)."""
+
+_response_cache = None
+_response_cache_lock = threading.Lock()
+
+
+def _get_response_cache():
+    """
+    Returns the on-disk response cache, creating it on first use.
+
+    Returns:
+        diskcache.Cache: The response cache, stored under `config.cache_dir`.
+    """
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            from diskcache import Cache
+
+            _response_cache = Cache(os.path.join(config.cache_dir, "responses"))
+    return _response_cache
+
+
+async def cached_get(client: httpx.AsyncClient, url: str) -> httpx.Response:
+    """
+    Sends a GET request, revalidating a previously cached response with `If-None-Match`/`If-Modified-Since`.
+
+    When the server answers 304 Not Modified, the cached body is returned as a regular 200 response. Successful
+    responses carrying an ETag or Last-Modified header are stored for the next call. Cache reads and writes run in the
+    default thread pool executor, so large bodies do not block the event loop. The cache is best effort: if it is
+    unavailable, a warning is logged and the request is sent without it.
+
+    Args:
+        client (httpx.AsyncClient): The client used to send the request.
+        url (str): The URL to request, relative to the client's base URL if it has one.
+
+    Returns:
+        httpx.Response: The server response, or the cached response if the resource did not change.
+    """
+    loop = asyncio.get_running_loop()
+    request = client.build_request("GET", url)
+    cache_key = str(request.url)
+    try:
+        cache = await loop.run_in_executor(None, _get_response_cache)
+        cached: Optional[CachedResponse] = await loop.run_in_executor(None, cache.get, cache_key)
+    except Exception as e:
+        logger.warning("Response cache unavailable, requesting {} without it: {}", cache_key, e)
+        return await client.send(request)
+    if cached is not None:
+        etag, last_modified, _, _ = cached
+        if etag:
+            request.headers["If-None-Match"] = etag
+        if last_modified:
+            request.headers["If-Modified-Since"] = last_modified
+
+    response = await client.send(request)
+    if response.status_code == 304 and cached is not None:
+        _, _, content_type, body = cached
+        return httpx.Response(200, headers={"content-type": content_type}, content=body, request=response.request)
+
+    if response.status_code == 200:
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if etag or last_modified:
+            content_type = response.headers.get("content-type", "")
+            try:
+                await loop.run_in_executor(
+                    None, cache.set, cache_key, (etag, last_modified, content_type, response.content)
+                )
+            except Exception as e:
+                logger.warning("Response cache unavailable, not storing {}: {}", cache_key, e)
+    return response
+
+
+def close_response_cache() -> None:
+    """
+    Closes the on-disk response cache, if it was opened.
+    """
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is not None:
+            _response_cache.close()
+            _response_cache = None
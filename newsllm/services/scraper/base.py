@@ -3,141 +3,498 @@ Author: Aayush Shah
 Description: This module provides the base classes for web scraping, including BaseScraper and ScraperMixins.
 """
 
-from abc import ABC, abstractmethod
-from typing import Dict, List, Union
+import asyncio
+from abc import ABC
+from collections import deque
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Deque, Dict, Iterable, List, Optional, Set, Union
 
-import aiohttp
-import requests
-from bs4 import BeautifulSoup
+import httpx
 from loguru import logger
-from playwright.async_api import Browser, Page, async_playwright
 
+from newsllm.services.scraper._cache import cached_get, close_response_cache
 from newsllm.structures import News
 from newsllm.utils import log_traceback
 
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, Playwright
+
 
 class BaseScraper(ABC):
     """
     Abstract base class for web scrapers.
 
+    Scrapers either implement `_get_post_collection` and `_get_single_post`, in which case posts are processed
+    concurrently by the default `_scrape`, or override `_scrape` with their own scraping logic. Instantiating a scraper
+    that does neither raises a TypeError.
+
     Attributes:
         scraper_name (str): Name of the scraper.
         base_url (str): Base URL for the scraper.
+        concurrency (int): Maximum number of posts processed concurrently.
+        batch_timestamp (str): ISO timestamp of the current scraping run, shared by all articles it yields.
     """
 
     scraper_name = "BaseScraper"
     base_url = None
     include_in_factory = False
+    concurrency = 8
+    batch_timestamp: Optional[str] = None
+
+    def __new__(cls, *args, **kwargs):
+        overrides_scrape = cls._scrape is not BaseScraper._scrape
+        overrides_hooks = (
+            cls._get_post_collection is not BaseScraper._get_post_collection
+            and cls._get_single_post is not BaseScraper._get_single_post
+        )
+        if not (overrides_scrape or overrides_hooks):
+            raise TypeError(
+                f"Can't instantiate scraper {cls.__name__} without overriding _scrape "
+                "or both _get_post_collection and _get_single_post"
+            )
+        return super().__new__(cls)
 
     async def scrape(self, **kwargs) -> List[News]:
         """
         Scrapes data and returns a list of news articles.
 
+        This keeps every scraped article in memory. Use `stream` to process articles one at a time.
+
         Args:
             **kwargs: Additional keyword arguments for scraping options.
 
         Returns:
             List[News]: A list of news articles.
         """
+        return [news async for news in self.stream(**kwargs)]
+
+    async def stream(self, **kwargs) -> AsyncIterator[News]:
+        """
+        Scrapes data and yields news articles as soon as they are available.
+
+        Args:
+            **kwargs: Additional keyword arguments for scraping options.
+
+        Yields:
+            News: The next scraped news article.
+
+        Raises:
+            TypeError: If `_scrape` does not return an async iterator, e.g. when it returns a list.
+        """
         verbose = kwargs.get("verbose", True)
         if verbose:
-            logger.info(f"Starting the data scraping from {self.__class__.__name__}")
-        news_list: List[News] = []
+            logger.info("Starting the data scraping from {}", self.__class__.__name__)
+        self.batch_timestamp = datetime.now().isoformat()
+        news_iterator = self._scrape(**kwargs)
+        if not isinstance(news_iterator, AsyncIterator):
+            if asyncio.iscoroutine(news_iterator):
+                news_iterator.close()
+            raise TypeError(
+                f"{self.__class__.__name__}._scrape must be an async generator or iterator yielding News, "
+                f"got {type(news_iterator).__name__}"
+            )
         try:
-            news_list = await self._scrape(**kwargs)
+            async for news in news_iterator:
+                yield news
         except Exception as e:
-            logger.error(f"Error occurred in {self.__class__.__name__} | {e}")
+            logger.error("Error occurred in {} | {}", self.__class__.__name__, e)
             log_traceback()
-        return news_list
+        finally:
+            if hasattr(news_iterator, "aclose"):
+                await news_iterator.aclose()
 
-    @abstractmethod
-    async def _scrape(self, **kwargs) -> List[News]:
+    async def aclose(self) -> None:
+        """
+        Releases resources held by the scraper, such as HTTP clients. Called once scraping is done.
         """
-        Abstract method to be implemented by subclasses for specific scraping logic.
+
+    async def _scrape(self, **kwargs) -> AsyncIterator[News]:
+        """
+        Fetches the posts to scrape and yields them as news articles, processing up to `concurrency` posts at a time.
+
+        Subclasses may override this with their own async generator for specific scraping logic.
 
         Args:
             **kwargs: Additional keyword arguments for scraping options.
+
+        Yields:
+            News: The next scraped news article.
+        """
+        post_collection = await self._get_post_collection(**kwargs)
+        posts = self._get_standard_data_list(post_collection, **kwargs)
+        try:
+            async for post in posts:
+                yield post
+        finally:
+            await posts.aclose()
+
+    async def _get_post_collection(self, **kwargs) -> List[Any]:
+        """
+        Fetches the raw data of the posts to scrape. Used by the default `_scrape`.
+
+        Args:
+            **kwargs: Additional keyword arguments for scraping options.
+
+        Returns:
+            List[Any]: The raw post data, one item per post.
         """
         raise NotImplementedError
 
+    async def _get_single_post(self, post, **kwargs) -> News:
+        """
+        Processes the raw data of a single post into a news article. Used by the default `_scrape`.
+
+        Args:
+            post: The raw post data.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            News: The processed news item.
+        """
+        raise NotImplementedError
+
+    async def _get_standard_data_list(self, post_collection, **kwargs) -> AsyncIterator[News]:
+        """
+        Processes a collection of posts into standardized news items, yielding them in the order of the collection.
+
+        Posts that fail to process are skipped. When a `limit` is given, no more than `limit` posts are processed at
+        a time, so a consumer that stops after `limit` news items does not process posts it will discard.
+
+        Args:
+            post_collection (list): A list of post data.
+            **kwargs: Additional keyword arguments.
+
+        Keyword Args:
+            limit (int, optional): Number of news items the consumer needs.
+
+        Yields:
+            News: The next processed news item.
+        """
+        concurrency = self.concurrency
+        limit = kwargs.get("limit")
+        if limit:
+            concurrency = min(concurrency, int(limit))
+        posts = ScraperMixins.iter_bounded((self._get_standard_post(post) for post in post_collection), concurrency)
+        try:
+            async for post in posts:
+                if post is not None:
+                    yield post
+        finally:
+            await posts.aclose()
+
+    async def _get_standard_post(self, post, **kwargs) -> Optional[News]:
+        """
+        Processes a single post into a standardized news item, logging any error.
+
+        Args:
+            post (dict): The post data.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            Optional[News]: The processed news item, or None if processing failed.
+        """
+        try:
+            news = await self._get_single_post(post)
+            news.source = self.scraper_name
+            news.scraped_at = self.batch_timestamp
+            return news
+        except Exception as e:
+            logger.error("Error on processing post in {}", self.__class__.__name__)
+            logger.error("Error: {}", e)
+            log_traceback()
+            return None
+
 
 class ScraperMixins:
     """
     Mixins class providing utility methods for scrapers.
+
+    A single HTTP client and a single headless browser are shared by all scrapers and created on first use. Call
+    `close_shared_clients` once scraping is done to shut them down. Both are bound to the event loop they were created
+    on, so they are recreated when used from another event loop, e.g. by a second `asyncio.run` call.
+
+    Attributes:
+        BROWSER_ONLY_DOMAINS (Set[str]): Domains whose pages are always rendered with the browser.
+        MIN_STATIC_PARAGRAPHS (int): Minimum number of paragraphs for a plain HTTP response to be used as is.
     """
 
+    BROWSER_ONLY_DOMAINS: Set[str] = set()
+    MIN_STATIC_PARAGRAPHS = 3
+
+    _http_client: Optional[httpx.AsyncClient] = None
+    _playwright: Optional["Playwright"] = None
+    _browser: Optional["Browser"] = None
+    _browser_lock: Optional[asyncio.Lock] = None
+    _shared_clients_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @staticmethod
+    async def gather_bounded(aws: Iterable[Awaitable], limit: int) -> List[Any]:
+        """
+        Runs awaitables concurrently, with at most `limit` of them running at the same time.
+
+        Args:
+            aws (Iterable[Awaitable]): The awaitables to run.
+            limit (int): The maximum number of awaitables running concurrently.
+
+        Returns:
+            List[Any]: The results, in the same order as the awaitables.
+        """
+        semaphore = asyncio.Semaphore(limit)
+
+        async def _bounded(aw: Awaitable) -> Any:
+            async with semaphore:
+                return await aw
+
+        return await asyncio.gather(*(_bounded(aw) for aw in aws))
+
+    @staticmethod
+    async def iter_bounded(aws: Iterable[Awaitable], limit: int) -> AsyncIterator[Any]:
+        """
+        Runs awaitables concurrently, with at most `limit` of them running at the same time, and yields their
+        results in input order.
+
+        The awaitables run in a sliding window: the next one is only started once the oldest one has been yielded,
+        and awaitables are taken from `aws` lazily. Awaitables that have not completed when the iterator is closed
+        are cancelled and awaited, and coroutines that never started are closed.
+
+        Args:
+            aws (Iterable[Awaitable]): The awaitables to run.
+            limit (int): The maximum number of awaitables running concurrently.
+
+        Yields:
+            Any: The result of the next awaitable, in input order.
+        """
+        aws = iter(aws)
+        window: Deque[asyncio.Future] = deque()
+        try:
+            for aw in aws:
+                window.append(asyncio.ensure_future(aw))
+                if len(window) >= limit:
+                    yield await window.popleft()
+            while window:
+                yield await window.popleft()
+        finally:
+            for task in window:
+                task.cancel()
+            await asyncio.gather(*window, return_exceptions=True)
+            for aw in aws:
+                if asyncio.iscoroutine(aw):
+                    aw.close()
+
     @staticmethod
     async def get_text_content(raw_content: str, find_by: str = None) -> str:
         """
-        Extracts text content from raw HTML using BeautifulSoup.
+        Extracts text content from raw HTML using selectolax (lexbor backend).
+
+        Parsing runs in the default thread pool executor, so it does not block the event loop while other requests
+        are in flight.
 
         Args:
             raw_content (str): Raw HTML content.
-            find_by (str, optional): HTML tag to find and extract text from. Defaults to None.
+            find_by (str, optional): CSS selector of the element to extract text from. Defaults to None.
 
         Returns:
             str: Extracted text content.
         """
-        bs4_obj = BeautifulSoup(raw_content, "html.parser")
-        text_content = ""
-        if find_by:
-            target_component = bs4_obj.find(find_by)
-            text_content = target_component.get_text() if target_component else ""
-        else:
-            text_content = bs4_obj.get_text()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, ScraperMixins._extract_text, raw_content, find_by)
+
+    @staticmethod
+    def _extract_text(raw_content: str, find_by: Optional[str] = None) -> str:
+        """
+        Parses raw HTML and returns the text of the selected element.
+
+        Args:
+            raw_content (str): Raw HTML content.
+            find_by (str, optional): CSS selector of the element to extract text from. Defaults to None.
+
+        Returns:
+            str: Extracted text content, or an empty string if the element was not found.
+        """
+        from selectolax.lexbor import LexborHTMLParser
+
+        tree = LexborHTMLParser(raw_content)
+        target_component = tree.css_first(find_by) if find_by else tree.body
+        return target_component.text(separator=" ", strip=True) if target_component else ""
+
+    @staticmethod
+    async def _get_browser() -> "Browser":
+        """
+        Returns the shared Playwright browser, launching it on first use.
+
+        Returns:
+            Browser: The shared headless Chromium browser.
+        """
+        ScraperMixins._bind_shared_clients_to_running_loop()
+        if ScraperMixins._browser is None:
+            from playwright.async_api import async_playwright
+
+            if ScraperMixins._browser_lock is None:
+                ScraperMixins._browser_lock = asyncio.Lock()
+            async with ScraperMixins._browser_lock:
+                if ScraperMixins._browser is None:
+                    ScraperMixins._playwright = await async_playwright().start()
+                    ScraperMixins._browser = await ScraperMixins._playwright.chromium.launch(headless=True)
+        return ScraperMixins._browser
+
+    @staticmethod
+    async def close_browser() -> None:
+        """
+        Closes the shared Playwright browser, if it was launched.
+        """
+        if ScraperMixins._browser is not None:
+            await ScraperMixins._browser.close()
+            ScraperMixins._browser = None
+        if ScraperMixins._playwright is not None:
+            await ScraperMixins._playwright.stop()
+            ScraperMixins._playwright = None
+        ScraperMixins._browser_lock = None
+
+    @staticmethod
+    def _bind_shared_clients_to_running_loop() -> None:
+        """
+        Forgets the shared HTTP client and browser if they were created on another event loop.
+
+        They cannot be used or closed once their event loop is closed, so they are recreated on the running loop.
+        """
+        loop = asyncio.get_running_loop()
+        if ScraperMixins._shared_clients_loop is not loop:
+            ScraperMixins._http_client = None
+            ScraperMixins._playwright = None
+            ScraperMixins._browser = None
+            ScraperMixins._browser_lock = None
+            ScraperMixins._shared_clients_loop = loop
+
+    @staticmethod
+    def _get_http_client() -> httpx.AsyncClient:
+        """
+        Returns the shared HTTP client, creating it on first use.
+
+        Returns:
+            httpx.AsyncClient: The shared HTTP/2 capable client.
+        """
+        ScraperMixins._bind_shared_clients_to_running_loop()
+        if ScraperMixins._http_client is None:
+            ScraperMixins._http_client = httpx.AsyncClient(
+                http2=True,
+                timeout=10,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            )
+        return ScraperMixins._http_client
+
+    @staticmethod
+    async def close_shared_clients() -> None:
+        """
+        Closes the shared HTTP client, browser and response cache, if they were created.
+        """
+        ScraperMixins._bind_shared_clients_to_running_loop()
+        if ScraperMixins._http_client is not None:
+            await ScraperMixins._http_client.aclose()
+            ScraperMixins._http_client = None
+        await ScraperMixins.close_browser()
+        close_response_cache()
+
+    @staticmethod
+    def _requires_browser(html_content: str) -> bool:
+        """
+        Heuristically checks whether a page needs JavaScript to render its content.
+
+        Pages with hardly any paragraphs but more script tags than paragraphs are treated as client-side rendered.
+
+        Args:
+            html_content (str): Raw HTML content fetched without a browser.
 
-        return text_content
+        Returns:
+            bool: True if the page should be rendered with the browser, False otherwise.
+        """
+        lowered = html_content.lower()
+        paragraph_count = lowered.count("<p>") + lowered.count("<p ")
+        script_count = lowered.count("<script")
+        return paragraph_count < ScraperMixins.MIN_STATIC_PARAGRAPHS and script_count > paragraph_count
 
     @staticmethod
     async def fetch_html_content(url: str) -> str:
         """
-        Fetches HTML content from a URL using Playwright.
+        Fetches HTML content from a URL.
+
+        A plain HTTP request is tried first. The page is only rendered with the shared Playwright browser if the
+        request or the response cache fails, the response is not HTML, the page looks client-side rendered, or the
+        domain is listed in `BROWSER_ONLY_DOMAINS`. Plain HTTP responses are cached on disk and revalidated with
+        conditional requests.
 
         Args:
             url (str): URL to fetch content from.
-            browser_type (str): Browser type to use with Playwright (default is "chromium").
 
         Returns:
             str: Fetched HTML content.
         """
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            html_content = None
+        if httpx.URL(url).host not in ScraperMixins.BROWSER_ONLY_DOMAINS:
             try:
-                await page.goto(url, timeout=60000)
-                await page.wait_for_load_state("networkidle")
-                html_content = await page.content()
-            except requests.exceptions.Timeout as e:
-                logger.warning(f"Timeout error fetching {url}: {e}")
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"Request error fetching {url}: {e}")
+                response = await cached_get(ScraperMixins._get_http_client(), url)
+                content_type = response.headers.get("content-type", "")
+                if response.status_code == 200 and "html" in content_type:
+                    html_content = response.text
+                    if not ScraperMixins._requires_browser(html_content):
+                        return html_content
             except Exception as e:
-                logger.warning(f"Error fetching {url}: {e}")
-            finally:
-                await browser.close()
-            return html_content
+                logger.debug("HTTP fetch failed for {}, falling back to browser: {}", url, e)
+        return await ScraperMixins.fetch_rendered_html_content(url)
+
+    @staticmethod
+    async def fetch_rendered_html_content(url: str) -> str:
+        """
+        Fetches HTML content from a URL using the shared Playwright browser.
+
+        Each call uses its own browser context, so pages do not share cookies or storage.
+
+        Args:
+            url (str): URL to fetch content from.
+
+        Returns:
+            str: Fetched HTML content.
+        """
+        from playwright.async_api import Error as PlaywrightError
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        browser = await ScraperMixins._get_browser()
+        context = await browser.new_context()
+        html_content = None
+        try:
+            page = await context.new_page()
+            await page.goto(url, timeout=60000)
+            await page.wait_for_load_state("networkidle")
+            html_content = await page.content()
+        except PlaywrightTimeoutError as e:
+            logger.warning("Timeout error fetching {}: {}", url, e)
+        except PlaywrightError as e:
+            logger.warning("Browser error fetching {}: {}", url, e)
+        except Exception as e:
+            logger.warning("Error fetching {}: {}", url, e)
+        finally:
+            await context.close()
+        return html_content
 
     @staticmethod
     async def _handle_site_request(url: str) -> Union[Dict, List, str]:
         """
-        Handles requests to the Hacker News site for specific post data.
+        Requests JSON data from a site using the shared HTTP client. Responses are cached on disk and revalidated
+        with conditional requests.
 
         Args:
             url (str): The URL to request.
 
         Returns:
-            dict: The post data.
+            Union[Dict, List, str]: The decoded response, or an empty dict if the request failed.
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        logger.error(f"Failed to fetch post data from Hacker News: {response.status}")
-                        return {}
-                    return await response.json()
+            response = await cached_get(ScraperMixins._get_http_client(), url)
+            if response.status_code != 200:
+                logger.error("Failed to fetch data from {}: {}", url, response.status_code)
+                return {}
+            return response.json()
         except Exception as e:
-            logger.error(f"Error on requesting data from the site: {self.__class__.__name__}")
-            logger.error(f"Error: {e}")
+            logger.error("Error on requesting data from the site: {}", url)
+            logger.error("Error: {}", e)
             log_traceback()
             return {}
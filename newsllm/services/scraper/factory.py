@@ -1,13 +1,21 @@
-import importlib
-import pkgutil
-from typing import List, Type
+import asyncio
+from typing import Dict, List, Optional, Type
 
 from loguru import logger
 
-import newsllm
+from newsllm.services.queue.codec import QueueCodec
 from newsllm.services.queue.factory import get_queue
-from newsllm.services.scraper.base import BaseScraper
-from newsllm.structures import News
+from newsllm.services.scraper.base import BaseScraper, ScraperMixins
+from newsllm.utils import import_string
+
+# Registry of available scrapers, imported on first use
+SCRAPER_CLASSES: Dict[str, str] = {
+    "hackernews": "newsllm.services.scraper.hackernews:HackerNewsScraper",
+    "techcrunch": "newsllm.services.scraper.techcrunch:TechCrunchScraper",
+}
+
+# Codec for queued news. The raw HTML is left out, as it is large and consumers only need the extracted text
+QUEUE_CODEC = QueueCodec(exclude={"raw_content"})
 
 
 class ScraperFactory:
@@ -19,31 +27,26 @@ class ScraperFactory:
         queue (Queue): Queue for processing scraped news.
     """
 
+    _scraper_classes: Optional[List[Type[BaseScraper]]] = None
+
     def __init__(self, **kwargs):
         self.scrapers = self.get_scrapers(**kwargs)
         self.queue = get_queue("llm-queue")
 
-    @staticmethod
-    def get_scraper_list() -> List[Type[BaseScraper]]:
+    @classmethod
+    def get_scraper_list(cls) -> List[Type[BaseScraper]]:
         """
-        Dynamically imports and returns a list of scraper classes that inherit from BaseScraper.
+        Imports and returns the list of registered scraper classes included in the factory.
+
+        The classes are resolved from `SCRAPER_CLASSES` on the first call and cached afterwards.
 
         Returns:
             List[Type[BaseScraper]]: List of scraper classes.
         """
-        scrapers = []
-        package = newsllm.services.scraper
-        prefix = package.__name__ + "."
-
-        for importer, modname, ispkg in pkgutil.iter_modules(package.__path__, prefix):
-            module = importlib.import_module(modname)
-            for attribute_name in dir(module):
-                attribute = getattr(module, attribute_name)
-                if isinstance(attribute, type) and issubclass(attribute, BaseScraper) and attribute is not BaseScraper:
-                    if getattr(attribute, "include_in_factory", True):
-                        scrapers.append(attribute)
-
-        return scrapers
+        if cls._scraper_classes is None:
+            scrapers = [import_string(path) for path in SCRAPER_CLASSES.values()]
+            cls._scraper_classes = [scraper for scraper in scrapers if getattr(scraper, "include_in_factory", True)]
+        return cls._scraper_classes
 
     def get_scrapers(self, **kwargs) -> List[BaseScraper]:
         """
@@ -58,25 +61,64 @@ class ScraperFactory:
         scrapers = self.get_scraper_list()
         return [scraper(**kwargs) for scraper in scrapers]
 
-    async def scrape(self, limit: int, **kwargs):
+    async def scrape(self, limit: Optional[int], **kwargs) -> int:
+        """
+        Scrapes news using the available scrapers concurrently and enqueues each item as soon as it is scraped.
+
+        Scraped items are not kept in memory once enqueued. Items are encoded with `QUEUE_CODEC`, so consumers
+        should decode them with `QueueCodec.decode`.
+
+        Args:
+            limit (Optional[int]): Maximum number of news items to scrape per scraper. If None, scrapes all news.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            int: Total number of news items enqueued.
+        """
+        logger.debug("Scraping news from {} scrapers with post limit {}", len(self.scrapers), limit)
+        try:
+            results = await asyncio.gather(
+                *(self._scrape_to_queue(scraper, limit, **kwargs) for scraper in self.scrapers),
+                return_exceptions=True,
+            )
+        finally:
+            await asyncio.gather(*(scraper.aclose() for scraper in self.scrapers))
+            await ScraperMixins.close_shared_clients()
+        total = 0
+        for scraper, count in zip(self.scrapers, results):
+            if isinstance(count, BaseException):
+                logger.error("Error occurred in {} | {}", scraper.scraper_name, count)
+                continue
+            logger.debug("Scraped {} news from {}!!!", count, scraper.scraper_name)
+            total += count
+        logger.debug("Total scraped news: {}!!!", total)
+        return total
+
+    async def _scrape_to_queue(self, scraper: BaseScraper, limit: Optional[int], **kwargs) -> int:
         """
-        Scrapes news using the available scrapers.
+        Streams news from a single scraper into the queue.
 
         Args:
-            limit (int): Maximum number of news items to scrape per scraper. if None, returns all news.
+            scraper (BaseScraper): The scraper to run.
+            limit (Optional[int]): Maximum number of news items to enqueue. If None, enqueues all news. The limit is
+                also passed to the scraper, so it does not process more posts than needed.
             **kwargs: Additional keyword arguments.
 
         Returns:
-            List[News]: List of scraped news items.
+            int: Number of news items enqueued.
         """
-        news_list: List[News] = []
-        logger.debug(f"Scraping news from {len(self.scrapers)} scrapers with post limit {limit}")
-        for scraper in self.scrapers:
-            scraped_news = await scraper.scrape(**kwargs)
-            logger.debug(f"Scraped {len(scraped_news)} news from {scraper.scraper_name}!!!")
-            if limit is not None:
-                scraped_news = scraped_news[:limit]
-            news_list.extend(scraped_news)
-            [self.queue.enqueue(news.model_dump_json()) for news in scraped_news]
-        logger.debug(f"Total scraped news: {len(news_list)}!!!")
-        return news_list
+        count = 0
+        if limit is not None and limit <= 0:
+            return count
+        if limit is not None:
+            kwargs["limit"] = limit
+        news_iterator = scraper.stream(**kwargs)
+        try:
+            async for news in news_iterator:
+                self.queue.enqueue(QUEUE_CODEC.encode(news))
+                count += 1
+                if limit is not None and count >= limit:
+                    break
+        finally:
+            await news_iterator.aclose()
+        return count
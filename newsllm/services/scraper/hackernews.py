@@ -3,16 +3,23 @@ Author: Aayush Shah
 Description: This module provides the HackerNews scraper which scrapes news from Hacker News.
 """
 
+import asyncio
 import os
 from datetime import datetime
-from typing import List
+from typing import Dict, List, Optional, Union
 
+import httpx
 from loguru import logger
 
+from newsllm.services.scraper._cache import cached_get
 from newsllm.services.scraper.base import BaseScraper, ScraperMixins
 from newsllm.structures import News
 from newsllm.utils import log_traceback, timeit
 
+TOP_STORIES_PATH = "/v0/topstories.json"
+ITEM_PATH_TEMPLATE = "/v0/item/%s.json"
+ITEM_URL_TEMPLATE = "https://news.ycombinator.com/item?id=%s"
+
 
 class HackerNewsScraper(BaseScraper, ScraperMixins):
     """
@@ -21,11 +28,75 @@ class HackerNewsScraper(BaseScraper, ScraperMixins):
     Attributes:
         scraper_name (str): Name of the scraper.
         base_url (str): Base URL for the scraper.
+        api_url (str): Base URL of the Hacker News Firebase API.
+        concurrency (int): Maximum number of concurrent requests.
     """
 
     scraper_name = "HackerNews"
     base_url = "https://news.ycombinator.com"
+    api_url = "https://hacker-news.firebaseio.com"
     include_in_factory = True
+    concurrency = 8
+
+    def __init__(self):
+        """
+        Initialize the HackerNewsScraper. The API client is created on first use.
+        """
+        self._api_client: Optional[httpx.AsyncClient] = None
+        self._api_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_api_client(self) -> httpx.AsyncClient:
+        """
+        Returns the client used for all requests to the Firebase API, creating it on first use.
+
+        A single HTTP/2 client lets the many small item requests share one multiplexed connection. The client is
+        bound to the event loop it was created on, so it is recreated when used from another event loop.
+
+        Returns:
+            httpx.AsyncClient: The API client.
+        """
+        loop = asyncio.get_running_loop()
+        if self._api_client_loop is not loop:
+            self._api_client = None
+            self._api_client_loop = loop
+        if self._api_client is None:
+            self._api_client = httpx.AsyncClient(
+                http2=True,
+                base_url=self.api_url,
+                timeout=10,
+                limits=httpx.Limits(max_connections=self.concurrency),
+            )
+        return self._api_client
+
+    async def aclose(self) -> None:
+        """
+        Closes the API client, if it was created on the running event loop.
+        """
+        if self._api_client is not None and self._api_client_loop is asyncio.get_running_loop():
+            await self._api_client.aclose()
+        self._api_client = None
+
+    async def _handle_site_request(self, path: str) -> Union[Dict, List]:
+        """
+        Requests data from the Hacker News Firebase API.
+
+        Args:
+            path (str): The API path to request, relative to `api_url`.
+
+        Returns:
+            Union[Dict, List]: The decoded response, or an empty dict if the request failed.
+        """
+        try:
+            response = await cached_get(self._get_api_client(), path)
+            if response.status_code != 200:
+                logger.error("Failed to fetch post data from Hacker News: {}", response.status_code)
+                return {}
+            return response.json()
+        except Exception as e:
+            logger.error("Error on requesting data from the site: {}", self.__class__.__name__)
+            logger.error("Error: {}", e)
+            log_traceback()
+            return {}
 
     def get_item_url(self, item_id: str) -> str:
         """
@@ -37,7 +108,7 @@ class HackerNewsScraper(BaseScraper, ScraperMixins):
         Returns:
             str: The URL for the item.
         """
-        return f"https://news.ycombinator.com/item?id={item_id}"
+        return ITEM_URL_TEMPLATE % item_id
 
     @timeit("HackerNews single post scraping")
     async def _get_single_post(self, post, **kwargs) -> News:
@@ -51,10 +122,9 @@ class HackerNewsScraper(BaseScraper, ScraperMixins):
         Returns:
             News: The processed news item.
         """
-        logger.info(f"Getting single post from {self.__class__.__name__} | post: {post}")
-        id = post["id"]
-        date_published = str(datetime.fromtimestamp(post["time"]))
-        status = "published"
+        id = str(post["id"])
+        logger.debug("Getting single post from {} | post: {}", self.__class__.__name__, id)
+        date_published = datetime.fromtimestamp(post["time"]).isoformat()
         post_link = post.get("url", self.get_item_url(id))
         author = post.get("by", "unknown author")
         post_title = post.get("title", "")
@@ -64,10 +134,9 @@ class HackerNewsScraper(BaseScraper, ScraperMixins):
         categories = post.get("categories", [])
         tags = post.get("tags", [])
 
-        post_json = dict(
+        return News(
             id=id,
             published_date=date_published,
-            status=status,
             url=post_link,
             title=post_title,
             author=author,
@@ -76,51 +145,23 @@ class HackerNewsScraper(BaseScraper, ScraperMixins):
             categories=categories,
             tags=tags,
         )
-        news = News(**post_json)
-        return news
 
-    async def _get_standard_data_list(self, post_collection, **kwargs) -> List[News]:
+    async def _get_post_collection(self, **kwargs) -> List[dict]:
         """
-        Processes a collection of posts into a standardized list of news items.
+        Fetches the item data of the top stories from Hacker News.
 
         Args:
-            post_collection (list): A list of post data.
             **kwargs: Additional keyword arguments.
 
         Returns:
-            List[News]: A list of processed news items.
-        """
-        posts = []
-        for post in post_collection:
-            try:
-                post_json = await self._get_single_post(post)
-                post_json.source = self.scraper_name
-                post_json.scraped_at = str(datetime.now())
-                posts.append(post_json)
-            except Exception as e:
-                logger.error(f"Error on getting single post from {self.__class__.__name__}")
-                logger.error(f"Error: {e}")
-                log_traceback()
-        return posts
-
-    async def _scrape(self, **kwargs) -> List[News]:
+            List[dict]: The item data of the top stories, or an empty list if the request failed.
         """
-        Scrapes the top stories from Hacker News.
-
-        Args:
-            **kwargs: Additional keyword arguments.
-
-        Returns:
-            List[News]: A list of scraped news items.
-        """
-        top_stories_url = "https://hacker-news.firebaseio.com/v0/topstories.json?print=pretty"
-        post_ids = await self._handle_site_request(top_stories_url)
-        post_collection = []
+        post_ids = await self._handle_site_request(TOP_STORIES_PATH)
+        if not post_ids:
+            return []
         news_limit = int(kwargs.get("limit", os.getenv("NEWS_LIMIT", 5)))
-        for post_id in post_ids[:news_limit]:
-            news_url = f"https://hacker-news.firebaseio.com/v0/item/{post_id}.json?print=pretty"
-            post_data = await self._handle_site_request(news_url)
-            if post_data:
-                post_collection.append(post_data)
-        posts = await self._get_standard_data_list(post_collection, **kwargs)
-        return posts
+        post_collection = await self.gather_bounded(
+            (self._handle_site_request(ITEM_PATH_TEMPLATE % post_id) for post_id in post_ids[:news_limit]),
+            self.concurrency,
+        )
+        return [post_data for post_data in post_collection if post_data]
@@ -3,13 +3,15 @@ Author: Aayush Shah
 Description: This module provides the TechCrunch scraper which scrapes news from TechCrunch.
 """
 
-from datetime import datetime
+from typing import List
 
-from loguru import logger
+from pydantic import HttpUrl, TypeAdapter
 
 from newsllm.services.scraper.base import BaseScraper, ScraperMixins
 from newsllm.structures import News
-from newsllm.utils import log_traceback, timeit
+from newsllm.utils import timeit
+
+HTTP_URL_ADAPTER = TypeAdapter(HttpUrl)
 
 
 class TechCrunchScraper(BaseScraper, ScraperMixins):
@@ -19,17 +21,22 @@ class TechCrunchScraper(BaseScraper, ScraperMixins):
     Attributes:
         scraper_name (str): Name of the scraper.
         base_url (str): Base URL for the scraper.
+        concurrency (int): Maximum number of posts processed concurrently.
     """
 
     scraper_name = "TechCrunch"
     base_url = "https://techcrunch.com"
     include_in_factory = True
+    concurrency = 20
 
     @timeit("TechCrunch single post scraping")
     async def _get_single_post(self, post, **kwargs) -> News:
         """
         Fetches and processes a single post from TechCrunch.
 
+        The WordPress API response is trusted, so the news item is built with `News.model_construct` to skip model
+        validation. Only the URL is validated, and ids, categories and tags are converted to strings up front.
+
         Args:
             post (dict): The post data.
             **kwargs: Additional keyword arguments.
@@ -37,23 +44,25 @@ class TechCrunchScraper(BaseScraper, ScraperMixins):
         Returns:
             News: The processed news item.
         """
-        id = post.get("id", "1234")
-        date_published = post.get("date", str(datetime.now()))
-        status = post.get("status", "published")
-        post_link = post.get("link", "")
-        author = post.get("yoast_head_json", {}).get("author", "UNKNOWN AUTHOR")
-        post_title = post.get("title", {}).get("rendered", post.get("slug", ""))
-        post_description = post.get("yoast_head_json", {}).get("og_description", "")
-        raw_content = post.get("content", {}).get("rendered", "")
-        categories = post.get("categories", [])
-        tags = post.get("tags", [])
+        yoast_head = post.get("yoast_head_json") or {}
+        title = post.get("title") or {}
+        content = post.get("content") or {}
+
+        id = str(post.get("id", "1234"))
+        date_published = post.get("date", self.batch_timestamp)
+        post_link = HTTP_URL_ADAPTER.validate_python(post.get("link", ""))
+        author = yoast_head.get("author", "UNKNOWN AUTHOR")
+        post_title = title.get("rendered", post.get("slug", ""))
+        post_description = yoast_head.get("og_description", "")
+        raw_content = content.get("rendered", "")
+        categories = [str(category) for category in post.get("categories", [])]
+        tags = [str(tag) for tag in post.get("tags", [])]
 
         text_content = await self.get_text_content(raw_content)
 
-        post_json = dict(
+        return News.model_construct(
             id=id,
             published_date=date_published,
-            status=status,
             url=post_link,
             title=post_title,
             author=author,
@@ -63,32 +72,6 @@ class TechCrunchScraper(BaseScraper, ScraperMixins):
             categories=categories,
             tags=tags,
         )
-        news = News(**post_json)
-        return news
-
-    async def _get_standard_data_list(self, post_collection, **kwargs):
-        """
-        Processes a collection of posts into a standardized list of news items.
-
-        Args:
-            post_collection (list): A list of post data.
-            **kwargs: Additional keyword arguments.
-
-        Returns:
-            List[News]: A list of processed news items.
-        """
-        posts = []
-        for post in post_collection:
-            try:
-                post_json = await self._get_single_post(post)
-                post_json.source = self.scraper_name
-                post_json.scraped_at = str(datetime.now())
-                posts.append(post_json)
-            except Exception as e:
-                logger.error(f"Error on processing post in {self.__class__.__name__}")
-                logger.error(f"Error: {e}")
-                log_traceback()
-        return posts
 
     def _get_metadata(self):
         """
@@ -99,22 +82,18 @@ class TechCrunchScraper(BaseScraper, ScraperMixins):
         """
         return {
             "site": self.__class__.__name__,
-            "scraped_at": str(datetime.now()),
+            "scraped_at": self.batch_timestamp,
         }
 
-    async def _scrape(self, **kwargs):
+    async def _get_post_collection(self, **kwargs) -> List[dict]:
         """
-        Scrapes the latest posts from TechCrunch.
+        Fetches the latest posts from the TechCrunch WordPress API.
 
         Args:
             **kwargs: Additional keyword arguments.
 
         Returns:
-            List[News]: A list of scraped news items.
+            List[dict]: The post data, or an empty list if the request failed.
         """
         url = f"{self.base_url}/wp-json/wp/v2/posts?categories=577047203&limit=50"
-        post_collection = await self._handle_site_request(url)
-        if not post_collection:
-            return []
-        posts = await self._get_standard_data_list(post_collection, **kwargs)
-        return posts
+        return await self._handle_site_request(url) or []
@@ -3,9 +3,11 @@ Author: Aayush Shah
 Description: Base classes and functionality for the summarizer module.
 """
 
+from typing import Dict, List, Optional, Set
+
 from loguru import logger
-from openai import OpenAI
-from tenacity import retry, stop_after_attempt, wait_random_exponential
+from openai import APIConnectionError, AsyncOpenAI, OpenAI, RateLimitError
+from tenacity import AsyncRetrying, Retrying, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 
 from newsllm.utils import timeit
 
@@ -22,6 +24,14 @@ Output:
 ```
 """
 
+RETRY_POLICY = dict(
+    wait=wait_random_exponential(min=2, max=6),
+    stop=stop_after_attempt(2),
+    retry=retry_if_exception_type((RateLimitError, APIConnectionError)),
+    reraise=True,
+)
+"""Retry policy for provider requests. Only rate limits and connection errors are retried."""
+
 
 class ModelNotFoundError(Exception):
     """Custom exception for when a specified model is not found."""
@@ -43,6 +53,8 @@ class BaseLLMProvider:
         self._api_key = api_key
         self._base_url = base_url
         self._client = self._create_client(api_key, base_url)
+        self._aclient = self._create_async_client(api_key, base_url)
+        self._model_cache: Optional[Set[str]] = None
 
     @staticmethod
     def _create_client(api_key: str, base_url: str) -> OpenAI:
@@ -58,6 +70,20 @@ class BaseLLMProvider:
         """
         return OpenAI(api_key=api_key, base_url=base_url)
 
+    @staticmethod
+    def _create_async_client(api_key: str, base_url: str) -> AsyncOpenAI:
+        """
+        Create an async OpenAI client.
+
+        Args:
+            api_key (str): The API key for authentication.
+            base_url (str): The base URL for the API.
+
+        Returns:
+            AsyncOpenAI: An instance of the async OpenAI client.
+        """
+        return AsyncOpenAI(api_key=api_key, base_url=base_url)
+
     @property
     def api_key(self) -> str:
         """API key property."""
@@ -73,29 +99,94 @@ class BaseLLMProvider:
         """Client property."""
         return self._client
 
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Async client property."""
+        return self._aclient
+
+    @staticmethod
+    def _model_names(models) -> Set[str]:
+        """
+        Normalize the names of the models listed by the provider for lookups.
+
+        Args:
+            models: The models listed by the provider.
+
+        Returns:
+            Set[str]: The lowercased model names, without provider prefixes.
+        """
+        return {model.name.split(":")[-1].strip().lower() for model in models}
+
     def _check_model_exists(self, model_name: str) -> bool:
         """
         Check if a model exists in the provider's model list.
 
+        The model list is fetched from the provider once and cached on the instance.
+
         Args:
             model_name (str): The name of the model to check.
 
         Returns:
             bool: True if the model exists, False otherwise.
         """
-        model_list = self._client.models.list()
-        model_list = [model.name.split(":")[-1].strip().lower() for model in model_list]
-        return model_name.lower() in model_list
+        if self._model_cache is None:
+            self._model_cache = self._model_names(self._client.models.list())
+        return model_name.lower() in self._model_cache
+
+    async def _acheck_model_exists(self, model_name: str) -> bool:
+        """
+        Asynchronous version of `_check_model_exists`, fetching the model list with the async client.
+
+        Args:
+            model_name (str): The name of the model to check.
+
+        Returns:
+            bool: True if the model exists, False otherwise.
+        """
+        if self._model_cache is None:
+            self._model_cache = self._model_names([model async for model in self._aclient.models.list()])
+        return model_name.lower() in self._model_cache
+
+    def _ensure_model(self, model_name: str, exists: bool) -> None:
+        """
+        Raise if the model was not found, otherwise log which model is used.
+
+        Args:
+            model_name (str): The name of the model to use.
+            exists (bool): Whether the model exists in the provider's model list.
+
+        Raises:
+            ModelNotFoundError: If the specified model is not found.
+        """
+        if not exists:
+            logger.error(f"Model {model_name} not found.")
+            raise ModelNotFoundError(f"Model {model_name} not found.")
+        logger.debug(f"Using {self.__class__.__name__} with model {model_name}.")
+
+    @staticmethod
+    def _build_messages(user_prompt: str) -> List[Dict[str, str]]:
+        """
+        Build the chat messages sent to the model.
+
+        Args:
+            user_prompt (str): The user prompt containing the article text.
+
+        Returns:
+            List[Dict[str, str]]: The system and user messages.
+        """
+        return [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt},
+        ]
 
-    @retry(
-        wait=wait_random_exponential(min=2, max=6),
-        stop=stop_after_attempt(2),
-    )
     @timeit("Provider call")
     def call(self, model_name: str, user_prompt: str, **kwargs) -> str:
         """
         Call the model to generate a summary and tags for the given prompt.
 
+        Rate limit and connection errors are retried according to `RETRY_POLICY`. Any other error is logged and an
+        empty string is returned.
+
         Args:
             model_name (str): The name of the model to use.
             user_prompt (str): The user prompt containing the article text.
@@ -106,20 +197,33 @@ class BaseLLMProvider:
         Raises:
             ModelNotFoundError: If the specified model is not found.
         """
-        if not self._check_model_exists(model_name):
-            logger.error(f"Model {model_name} not found.")
-            raise ModelNotFoundError(f"Model {model_name} not found.")
+        self._ensure_model(model_name, self._check_model_exists(model_name))
+        try:
+            for attempt in Retrying(**RETRY_POLICY):
+                with attempt:
+                    res = self._client.chat.completions.create(
+                        model=model_name, messages=self._build_messages(user_prompt), **kwargs
+                    )
+            return res.choices[0].message.content
+        except Exception as e:
+            logger.error(f"Error: {e}")
+            return ""
 
-        logger.debug(f"Using {self.__class__.__name__} with model {model_name}.")
+    @timeit("Provider call")
+    async def acall(self, model_name: str, user_prompt: str, **kwargs) -> str:
+        """
+        Asynchronous version of `call`, using the async client so the event loop is never blocked.
+
+        Raises:
+            ModelNotFoundError: If the specified model is not found.
+        """
+        self._ensure_model(model_name, await self._acheck_model_exists(model_name))
         try:
-            res = self._client.chat.completions.create(
-                model=model_name,
-                messages=[
-                    {"role": "system", "content": SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ],
-                **kwargs,
-            )
+            async for attempt in AsyncRetrying(**RETRY_POLICY):
+                with attempt:
+                    res = await self._aclient.chat.completions.create(
+                        model=model_name, messages=self._build_messages(user_prompt), **kwargs
+                    )
             return res.choices[0].message.content
         except Exception as e:
             logger.error(f"Error: {e}")
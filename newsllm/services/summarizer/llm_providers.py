@@ -5,6 +5,7 @@ Description: Provider classes for different summarization APIs, inherited from t
 
 import os
 
+from newsllm.config import config
 from newsllm.services.summarizer.base import BaseLLMProvider, ModelNotFoundError
 
 
@@ -25,7 +26,7 @@ class OpenRouterProvider(BaseLLMProvider):
         Args:
             api_key (str, optional): API key for the OpenRouter API. If not provided, it will be fetched from the environment variable 'OPENROUTER_API_KEY'.
         """
-        api_key = api_key or os.getenv("OPENROUTER_API_KEY", "")
+        api_key = api_key or config.openrouter_api_key
         if not api_key:
             raise ValueError("API key is required for OpenRouterProvider.")
         super().__init__(
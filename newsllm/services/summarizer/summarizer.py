@@ -3,19 +3,44 @@ Author: Aayush Shah
 Description: Summarizer module for generating summaries of text content using various providers.
 """
 
-import json
+import asyncio
+import hashlib
 import os
 import re
+from typing import Iterable, List, Optional, Tuple, Type
 
+import orjson
 from loguru import logger
 
+from newsllm.config import config
 from newsllm.services.summarizer.base import BaseLLMProvider
 from newsllm.services.summarizer.llm_providers import LLMProviderFactory
 
 DEFAULT_PROVIDER = os.getenv("SUMMARY_PROVIDER", "openrouter")
 SUMMARIZER_MODEL = os.getenv("SUMMARIZER_MODEL", "google/gemini-flash-1.5")
 
-DEFAULT_SUMMARY_PROVIDER: BaseLLMProvider = LLMProviderFactory.get_provider(DEFAULT_PROVIDER)
+DEFAULT_SUMMARY_PROVIDER: Type[BaseLLMProvider] = LLMProviderFactory.get_provider(DEFAULT_PROVIDER)
+
+REPEATED_WHITESPACE_PATTERN = re.compile(r"(\s)\1+")
+CODE_FENCE = "```"
+JSON_FENCE_LANGUAGE = "json"
+
+_summary_cache = None
+
+
+def _get_summary_cache():
+    """
+    Returns the on-disk summary cache, creating it on first use.
+
+    Returns:
+        diskcache.Cache: The summary cache, stored under `config.cache_dir`.
+    """
+    global _summary_cache
+    if _summary_cache is None:
+        from diskcache import Cache
+
+        _summary_cache = Cache(os.path.join(config.cache_dir, "summaries"))
+    return _summary_cache
 
 
 class Summarizer:
@@ -31,12 +56,10 @@ class Summarizer:
             provider (str, optional): Name of the provider to use. Defaults to environment variable 'SUMMARY_PROVIDER'.
             model (str, optional): Name of the model to use. Defaults to environment variable 'SUMMARIZER_MODEL'.
         """
-        self.provider: BaseLLMProvider = DEFAULT_SUMMARY_PROVIDER
+        provider_class = LLMProviderFactory.get_provider(provider) if provider else DEFAULT_SUMMARY_PROVIDER
+        self.provider: BaseLLMProvider = provider_class()
         self.model = SUMMARIZER_MODEL
 
-        if provider:
-            self.provider = ProviderFactory.get_provider(provider)
-
         if model:
             self.model = model
 
@@ -44,26 +67,155 @@ class Summarizer:
         """
         Generate a summary for the given text content.
 
+        Summaries are cached on disk by model and content hash, so unchanged content is only summarized once. If the
+        cache is unavailable, the provider is called directly.
+
         Args:
             text_content (str): The text content to summarize.
 
         Returns:
             dict: A dictionary containing the summary and tags.
         """
+        cache_key, cached = self._lookup(text_content)
+        if cached is not None:
+            return cached
         try:
             summary = self.provider.call(model_name=self.model, user_prompt=text_content)
-            summary_data = self.normalize_text(summary)
-            summary_data = self.extract_json(summary_data)
-            llm_res_dict = {}
-
-            if summary_data:
-                llm_res_dict = self.load_json(summary_data)
+            return self._finish(cache_key, summary)
+        except Exception as e:
+            logger.error(f"Error in summarizing content: {e}")
+            return {}
 
-            return llm_res_dict
+    async def asummarize(self, text_content: str) -> dict:
+        """
+        Asynchronous version of `summarize`. Summary cache reads and writes run in the default thread pool executor, so
+        the event loop is never blocked on disk I/O.
+        """
+        loop = asyncio.get_running_loop()
+        cache_key, cached = await loop.run_in_executor(None, self._lookup, text_content)
+        if cached is not None:
+            return cached
+        try:
+            summary = await self.provider.acall(model_name=self.model, user_prompt=text_content)
+            return await loop.run_in_executor(None, self._finish, cache_key, summary)
         except Exception as e:
             logger.error(f"Error in summarizing content: {e}")
             return {}
 
+    async def summarize_many(self, texts: Iterable[str], concurrency: int = 8) -> List[dict]:
+        """
+        Generate summaries for several text contents concurrently.
+
+        Args:
+            texts (Iterable[str]): The text contents to summarize.
+            concurrency (int, optional): Maximum number of concurrent provider calls. Defaults to 8.
+
+        Returns:
+            List[dict]: The summaries and tags, in the same order as the text contents.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _summarize_one(text_content: str) -> dict:
+            async with semaphore:
+                return await self.asummarize(text_content)
+
+        return await asyncio.gather(*(_summarize_one(text_content) for text_content in texts))
+
+    def _cache_key(self, text_content: str) -> str:
+        """
+        Build the summary cache key for the given text content.
+
+        Args:
+            text_content (str): The text content to summarize.
+
+        Returns:
+            str: A hash of the model name and the text content.
+        """
+        digest = hashlib.blake2b(self.model.encode(), digest_size=16)
+        digest.update(b"\0")
+        digest.update(text_content.encode())
+        return digest.hexdigest()
+
+    def _lookup(self, text_content: str) -> Tuple[str, Optional[dict]]:
+        """
+        Compute the cache key for the given text content and load its cached summary.
+
+        Args:
+            text_content (str): The text content to summarize.
+
+        Returns:
+            Tuple[str, Optional[dict]]: The cache key and the cached summary, if any.
+        """
+        cache_key = self._cache_key(text_content)
+        return cache_key, self._load(cache_key)
+
+    def _finish(self, cache_key: str, summary: str) -> dict:
+        """
+        Parse the provider output and store the result in the summary cache.
+
+        Args:
+            cache_key (str): The cache key of the summarized content.
+            summary (str): The raw provider output.
+
+        Returns:
+            dict: The parsed summary.
+        """
+        return self._store(cache_key, self._process(summary))
+
+    @staticmethod
+    def _load(cache_key: str) -> Optional[dict]:
+        """
+        Load a parsed summary from the summary cache.
+
+        Args:
+            cache_key (str): The summary cache key.
+
+        Returns:
+            Optional[dict]: The cached summary and tags, or None if not cached or the cache is unavailable.
+        """
+        try:
+            return _get_summary_cache().get(cache_key)
+        except Exception as e:
+            logger.warning("Summary cache unavailable: {}", e)
+            return None
+
+    @staticmethod
+    def _store(cache_key: str, llm_res_dict: dict) -> dict:
+        """
+        Store a parsed summary in the summary cache. Empty results are not cached so they are retried next time.
+
+        A cache failure is logged and does not affect the returned summary.
+
+        Args:
+            cache_key (str): The summary cache key.
+            llm_res_dict (dict): The parsed summary and tags.
+
+        Returns:
+            dict: The parsed summary and tags.
+        """
+        if llm_res_dict:
+            try:
+                _get_summary_cache().set(cache_key, llm_res_dict)
+            except Exception as e:
+                logger.warning("Summary cache unavailable: {}", e)
+        return llm_res_dict
+
+    def _process(self, summary: str) -> dict:
+        """
+        Parse the raw provider output into a dictionary.
+
+        The fenced JSON block is handed straight to the JSON parser. Whitespace does not need to be normalized first,
+        as the parser ignores it.
+
+        Args:
+            summary (str): The raw provider output.
+
+        Returns:
+            dict: A dictionary containing the summary and tags, or an empty dict if none was found.
+        """
+        summary_data = self.extract_json(summary)
+        return self.load_json(summary_data) if summary_data else {}
+
     @staticmethod
     def normalize_text(text: str) -> str:
         """
@@ -75,13 +227,16 @@ class Summarizer:
         Returns:
             str: The normalized text.
         """
-        text = re.sub(r"(\s)\1+", r"\1", text)
+        text = REPEATED_WHITESPACE_PATTERN.sub(r"\1", text)
         return text.strip()
 
     @staticmethod
     def extract_json(text: str):
         """
-        Extract JSON content from the given text.
+        Extract JSON content from the first fenced code block in the given text.
+
+        The opening fence may be tagged with `json`. The block is located with plain string searches rather than a
+        regular expression.
 
         Args:
             text (str): The text containing JSON content.
@@ -89,11 +244,16 @@ class Summarizer:
         Returns:
             Union[str, None]: The extracted JSON string or None if not found.
         """
-        pattern = re.compile(r"```json(.*?)```|```(.*?)```", re.DOTALL)
-        match = pattern.search(text)
-        if match:
-            return match.group(1).strip() if match.group(1) else match.group(2).strip()
-        return None
+        start = text.find(CODE_FENCE)
+        if start == -1:
+            return None
+        start += len(CODE_FENCE)
+        if text.startswith(JSON_FENCE_LANGUAGE, start):
+            start += len(JSON_FENCE_LANGUAGE)
+        end = text.find(CODE_FENCE, start)
+        if end == -1:
+            return None
+        return text[start:end].strip()
 
     @staticmethod
     def load_json(text: str) -> dict:
@@ -107,7 +267,7 @@ class Summarizer:
             dict: The loaded dictionary.
         """
         try:
-            return json.loads(text)
-        except json.JSONDecodeError as e:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError as e:
             logger.error(f"Error loading JSON: {e}")
             return {}
@@ -3,8 +3,10 @@ Author: Aayush Shah
 Description: Utility functions for logging and performance measurement.
 """
 
+import importlib
+import inspect
+import os
 import time
-import traceback
 from functools import wraps
 from typing import Any, Callable, Union
 
@@ -14,8 +16,24 @@ MessageType = Union[str, Callable[[Any], str]]
 
 
 def log_traceback():
-    """Log the current traceback using loguru logger."""
-    logger.error(f"Traceback: {traceback.format_exc()}")
+    """Log the traceback of the exception being handled using loguru logger.
+
+    The traceback is only formatted if a sink accepts the record.
+    """
+    logger.opt(exception=True, depth=1).error("Traceback")
+
+
+def import_string(path: str) -> Any:
+    """Import an object from a "module.path:attribute" string.
+
+    Args:
+        path (str): The module path and attribute name, separated by a colon.
+
+    Returns:
+        Any: The imported object.
+    """
+    module_name, _, attribute_name = path.partition(":")
+    return getattr(importlib.import_module(module_name), attribute_name)
 
 
 def str_to_bool(val: str) -> bool:
@@ -33,25 +51,39 @@ def str_to_bool(val: str) -> bool:
 def timeit(message: MessageType = "Execution Time") -> Callable:
     """Decorator to measure the execution time of a function and log it.
 
+    Timing is only enabled when the `NEWSLLM_PROFILE` environment variable is truthy at import time. Otherwise the
+    function is returned unchanged, so it carries no overhead. Coroutine functions are timed until they complete.
+
     Args:
         message (MessageType): A static message or a callable returning a message to log.
 
     Returns:
         Callable: The decorated function with execution time logging.
     """
+    if not str_to_bool(os.getenv("NEWSLLM_PROFILE", "")):
+        return lambda func: func
+
+    def log_elapsed_time(func: Callable, args: tuple, elapsed_time: float) -> None:
+        msg = message(args[0]) if callable(message) else message
+        logger.debug(f"{msg}: {func.__name__} took {elapsed_time:.4f} seconds to execute")
 
     def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                start_time = time.perf_counter()
+                result = await func(*args, **kwargs)
+                log_elapsed_time(func, args, time.perf_counter() - start_time)
+                return result
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            start_time = time.time()
+            start_time = time.perf_counter()
             result = func(*args, **kwargs)
-            end_time = time.time()
-            elapsed_time = end_time - start_time
-            if callable(message):
-                msg = message(args[0])
-            else:
-                msg = message
-            logger.debug(f"{msg}: {func.__name__} took {elapsed_time:.4f} seconds to execute")
+            log_elapsed_time(func, args, time.perf_counter() - start_time)
             return result
 
         return wrapper